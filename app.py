@@ -1,15 +1,41 @@
-from flask import Flask, request, jsonify, send_file, render_template_string
+# Must run before anything else imports socket, ssl, subprocess, ...
+from gevent import monkey
+monkey.patch_all()
+
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from diskcache import Cache
+from urllib.parse import quote, urlsplit
+import orjson
 import yt_dlp
+import collections
+import hashlib
 import os
-import re
+import queue
+import subprocess
+import sys
+import unicodedata
 from pathlib import Path
 import tempfile
+import threading
 import time
 
 # ================== APP SETUP ==================
+class OrjsonProvider(JSONProvider):
+    # request.json and jsonify() go through orjson's C encoder/decoder
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
+# Let Apache (mod_xsendfile) serve cached files when fronting the app
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE") == "1"
 
 # ================== FFMPEG ==================
 # Render already has FFmpeg installed
@@ -18,6 +44,82 @@ FFMPEG_PATH = None
 # ================== DOWNLOAD DIRECTORY ==================
 DOWNLOAD_DIR = Path(tempfile.gettempdir()) / "yt_downloads"
 DOWNLOAD_DIR.mkdir(exist_ok=True)
+# Internal nginx location aliased to DOWNLOAD_DIR (e.g. "/protected/");
+# when set, nginx sends cached files itself via X-Accel-Redirect
+X_ACCEL_PREFIX = os.environ.get("X_ACCEL_PREFIX")
+# Finished downloads are kept up to this size, least recently used
+# evicted first by the background sweep
+MAX_CACHE_BYTES = int(os.environ.get("MAX_CACHE_BYTES", 10 * 1024 ** 3))
+
+# ================== INFO CACHE ==================
+# Repeat lookups (video-info followed by a download) skip yt-dlp entirely
+INFO_TTL = 600
+info_cache = Cache(
+    str(DOWNLOAD_DIR / "info"),
+    size_limit=64 * 1024 * 1024,
+    eviction_policy="least-recently-used",
+)
+
+# ================== STREAMING ==================
+# 1 MB reads and pipe buffers keep syscall overhead low on large files
+CHUNK_SIZE = 1 << 20
+# How much of a failed yt-dlp's stderr is read, and returned to the client
+ERROR_TAIL = 4096
+ERROR_MAX = 500
+
+# ================== CONCURRENCY LIMITS ==================
+class ServerBusy(Exception):
+    pass
+
+
+class SlotPool:
+    # At most `size` holders at once. Up to `max_waiting` more callers
+    # queue for a slot for at most `timeout` seconds; anyone beyond that
+    # gets ServerBusy straight away. Freed slots are handed directly to
+    # the oldest waiter, so newcomers can never jump the queue
+    def __init__(self, size, max_waiting, timeout):
+        self._free = size
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+        self.max_waiting = max_waiting
+        self.timeout = timeout
+
+    def acquire(self):
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            if len(self._waiters) >= self.max_waiting:
+                raise ServerBusy()
+            handoff = threading.Event()
+            self._waiters.append(handoff)
+
+        if handoff.wait(self.timeout):
+            return
+        with self._lock:
+            # A release may have handed the slot over just as we timed out
+            if handoff.is_set():
+                return
+            self._waiters.remove(handoff)
+        raise ServerBusy()
+
+    def release(self):
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._free += 1
+
+
+# Limits are per worker (gunicorn runs one per CPU). Oversubscribing the
+# CPU with yt-dlp/ffmpeg only makes every job slower, so extra requests
+# wait in a short queue and get a 503 once that is full
+MAX_DOWNLOADS = int(os.environ.get("MAX_DOWNLOADS", 2))
+MAX_INFO_LOOKUPS = int(os.environ.get("MAX_INFO_LOOKUPS", 4))
+MAX_QUEUED = int(os.environ.get("MAX_QUEUED", 50))
+QUEUE_TIMEOUT = 120
+download_slots = SlotPool(MAX_DOWNLOADS, MAX_QUEUED, QUEUE_TIMEOUT)
+info_slots = SlotPool(MAX_INFO_LOOKUPS, MAX_QUEUED, QUEUE_TIMEOUT)
 
 # ================== HTML TEMPLATE ==================
 HTML_TEMPLATE = """
@@ -111,27 +213,88 @@ async function download(type) {
 </body>
 </html>
 """
+# The page has no template variables, so encode it once at import
+_INDEX_BYTES = HTML_TEMPLATE.encode("utf-8")
 
 # ================== HELPERS ==================
+YOUTUBE_HOSTS = frozenset({
+    "youtube.com", "www.youtube.com", "youtu.be", "www.youtu.be",
+})
+
+
 def validate_youtube_url(url):
-    patterns = [
-        r"(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+",
-        r"(https?://)?(www\.)?youtube\.com/watch\?v=[\w-]+",
-        r"(https?://)?(www\.)?youtu\.be/[\w-]+",
-    ]
-    return any(re.match(p, url) for p in patterns)
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    return (
+        parts.scheme in ("http", "https")
+        and parts.netloc in YOUTUBE_HOSTS
+        and parts.path.startswith("/")
+        and bool(parts.path[1:] or parts.query or parts.fragment)
+    )
+
+
+_FILENAME_TRANS = str.maketrans("", "", '<>:"/\\|?*')
 
 
 def clean_filename(name):
-    name = re.sub(r'[<>:"/\\|?*]', "", name).strip(". ")
+    name = name.translate(_FILENAME_TRANS).strip(". ")
     return name[:200] if name else "download"
 
 
+def cache_path(video_id, ext):
+    # Content-addressed by video rather than URL, so youtu.be links,
+    # watch URLs with extra parameters etc. all share one file
+    key = hashlib.blake2b(
+        f"{video_id}:{ext}".encode(), digest_size=16).hexdigest()
+    return DOWNLOAD_DIR / f"{key}.{ext}"
+
+
 def clean_old_files():
+    # Keep the most recently used downloads up to MAX_CACHE_BYTES, and
+    # drop partial files abandoned by a crashed or killed worker
     now = time.time()
-    for f in DOWNLOAD_DIR.iterdir():
-        if f.is_file() and now - f.stat().st_mtime > 3600:
-            f.unlink()
+    files, total = [], 0
+    with os.scandir(DOWNLOAD_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            st = entry.stat()
+            if entry.name.endswith(".part"):
+                if now - st.st_mtime > 3600:
+                    files.append((0, st.st_size, entry.path))
+                continue
+            if entry.name.endswith((".mp4", ".mp3")):
+                files.append((st.st_atime, st.st_size, entry.path))
+                total += st.st_size
+
+    files.sort()
+    for atime, size, path in files:
+        if atime and total <= MAX_CACHE_BYTES:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        if atime:
+            total -= size
+
+
+def _gc_loop():
+    while True:
+        clean_old_files()
+        time.sleep(GC_INTERVAL)
+
+
+def content_disposition(name):
+    try:
+        name.encode("ascii")
+        return f'attachment; filename="{name}"'
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", name)
+        simple = simple.encode("ascii", "ignore").decode("ascii")
+        quoted = quote(name, safe="!#$&+-.^_`|~")
+        return f"attachment; filename=\"{simple}\"; filename*=UTF-8''{quoted}"
 
 
 def get_ydl_opts():
@@ -144,12 +307,297 @@ def get_ydl_opts():
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
         ),
         "referer": "https://www.youtube.com/",
+        # Fetch DASH/HLS fragments in parallel to work around
+        # per-connection throttling
+        "concurrent_fragment_downloads": 8,
+        "http_chunk_size": 10 * 1024 * 1024,
+        "retries": 3,
+        "fragment_retries": 3,
+        # watch?v=...&list=... means the video, not its playlist
+        "noplaylist": True,
+        # Only YouTube URLs get past validation, so register just the
+        # YouTube extractors (YoutubeYtBe etc. included) plus generic,
+        # which follows redirects for scheme-less and www.youtu.be URLs
+        "allowed_extractors": ["youtube.*", "generic"],
+    }
+
+
+def get_ydl_cmd(source, fmt, *extra):
+    # CLI equivalent of get_ydl_opts(), writing the media to stdout;
+    # `source` is the URL, or arguments telling yt-dlp where to load it
+    opts = get_ydl_opts()
+    return [
+        sys.executable, "-m", "yt_dlp",
+        "--quiet", "--no-warnings",
+        *(["--no-playlist"] if opts["noplaylist"] else []),
+        "--no-check-certificates",
+        "--socket-timeout", str(opts["socket_timeout"]),
+        "--user-agent", opts["user_agent"],
+        "--referer", opts["referer"],
+        "--concurrent-fragments", str(opts["concurrent_fragment_downloads"]),
+        "--http-chunk-size", str(opts["http_chunk_size"]),
+        "--retries", str(opts["retries"]),
+        "--fragment-retries", str(opts["fragment_retries"]),
+        "--use-extractors", ",".join(opts["allowed_extractors"]),
+        "-f", fmt,
+        "-o", "-",
+        *extra,
+        *source,
+    ]
+
+
+def spawn_ydl(url, video_id, fmt, *extra, stderr):
+    # Feed the subprocess the info get_info() already extracted, so a
+    # cache miss costs one extraction instead of two. If that entry has
+    # expired yt-dlp extracts again from the URL; the interpreter start-up
+    # is paid either way
+    info_json = info_cache.get(("json", video_id))
+    if info_json is None:
+        source, stdin = [url], subprocess.DEVNULL
+    else:
+        source, stdin = ["--load-info-json", "-"], tempfile.TemporaryFile()
+        stdin.write(info_json)
+        stdin.seek(0)
+    try:
+        return subprocess.Popen(
+            get_ydl_cmd(source, fmt, *extra),
+            stdin=stdin, stdout=subprocess.PIPE, stderr=stderr,
+            bufsize=CHUNK_SIZE,
+        )
+    finally:
+        if info_json is not None:
+            stdin.close()
+
+
+# YoutubeDL instances are not safe to share between concurrent requests,
+# so keep a pool of warm ones (extractors loaded, connections open) and
+# hand each request its own
+_info_ydls = queue.SimpleQueue()
+
+
+def _get_info_ydl():
+    try:
+        return _info_ydls.get_nowait()
+    except queue.Empty:
+        opts = get_ydl_opts()
+        opts["skip_download"] = True
+        # Don't resolve every entry of a playlist just to reject it
+        opts["extract_flat"] = "in_playlist"
+        return yt_dlp.YoutubeDL(opts)
+
+
+# Merging separate streams to stdout makes yt-dlp use ffmpeg as the
+# downloader, which fetches both URLs itself in single unchunked requests:
+# http_chunk_size and concurrent fragments don't apply, and YouTube
+# throttles unchunked requests. A progressive MP4 goes through yt-dlp's
+# own chunked downloader, so the merge is only worth it when it buys a
+# higher resolution
+PROGRESSIVE_FORMAT = "b[ext=mp4]/b"
+MERGED_FORMAT = "bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]/b"
+
+
+def pick_video_format(info):
+    progressive = video_only = 0
+    for f in info.get("formats") or ():
+        if f.get("ext") != "mp4" or f.get("vcodec", "none") == "none":
+            continue
+        height = f.get("height") or 0
+        if f.get("acodec", "none") == "none":
+            video_only = max(video_only, height)
+        else:
+            progressive = max(progressive, height)
+    if progressive and progressive >= video_only:
+        return PROGRESSIVE_FORMAT
+    return MERGED_FORMAT
+
+
+def get_info(url):
+    if (payload := info_cache.get(url)) is not None:
+        return payload
+
+    info_slots.acquire()
+    try:
+        ydl = _get_info_ydl()
+        try:
+            info = ydl.extract_info(url, download=False)
+        finally:
+            _info_ydls.put(ydl)
+    finally:
+        info_slots.release()
+
+    # Playlist/channel pages have no single video to key downloads on
+    if info.get("_type") == "playlist":
+        return None
+
+    # Full info for the download subprocess (see spawn_ydl)
+    info_cache.set(("json", info["id"]),
+                   orjson.dumps(yt_dlp.YoutubeDL.sanitize_info(info)),
+                   expire=INFO_TTL)
+    info_cache.set(("video_format", info["id"]), pick_video_format(info),
+                   expire=INFO_TTL)
+    payload = {
+        "id": info["id"],
+        "title": info.get("title"),
+        "duration": info.get("duration"),
+        "uploader": info.get("uploader"),
     }
+    info_cache.set(url, payload, expire=INFO_TTL)
+    return payload
+
+
+def get_request_url():
+    # Download routes also accept GET/HEAD ?url=... because Range and
+    # If-None-Match are only honoured for those methods, letting clients
+    # probe, resume or split cached downloads
+    if request.method in ("GET", "HEAD"):
+        return request.args.get("url", "").strip()
+    return request.json.get("url", "").strip()
+
+
+def send_cached(path, mimetype, download_name):
+    # Refresh atime so the LRU sweep sees this file as recently used;
+    # mtime is kept so ETag/Last-Modified stay stable for revalidation
+    os.utime(path, (time.time(), path.stat().st_mtime))
+    if X_ACCEL_PREFIX:
+        return Response(mimetype=mimetype, headers={
+            "X-Accel-Redirect": X_ACCEL_PREFIX + path.name,
+            "Content-Disposition": content_disposition(download_name),
+        })
+    return send_file(path, as_attachment=True,
+                     download_name=download_name,
+                     mimetype=mimetype, conditional=True)
+
+
+def not_cached(mimetype, download_name):
+    # HEAD on a cache miss: describe the download without spawning
+    # anything or taking a download slot. Streamed downloads have no
+    # length and cannot be resumed, so tell probing clients up front
+    return Response(mimetype=mimetype, headers={
+        "Content-Disposition": content_disposition(download_name),
+        "Accept-Ranges": "none",
+    })
+
+
+def busy():
+    resp = jsonify({"error": "Server busy, please try again shortly"})
+    resp.headers["Retry-After"] = "30"
+    return resp, 503
+
+
+def reap(procs):
+    for p in procs:
+        if p.poll() is None:
+            p.kill()
+        p.wait()
+
+
+def error_message(errors):
+    # Only look at the tail of yt-dlp's stderr and report its last ERROR:
+    # line (or last line), never the whole log
+    errors.seek(0, os.SEEK_END)
+    errors.seek(max(0, errors.tell() - ERROR_TAIL))
+    lines = errors.read().decode(errors="replace").splitlines()
+    lines = [line.strip() for line in lines if line.strip()]
+    for line in reversed(lines):
+        if line.startswith("ERROR:"):
+            return line[:ERROR_MAX]
+    return lines[-1][:ERROR_MAX] if lines else "Download failed"
+
+
+def discard_part(f, part):
+    if f is not None:
+        try:
+            f.close()
+        except OSError:
+            pass
+    if part is not None:
+        try:
+            os.unlink(part)
+        except FileNotFoundError:
+            pass
+    return None, None
+
+
+def stream_process(procs, errors, mimetype, download_name, cache_to):
+    # Takes over the download slot acquired by the caller and frees it
+    # once the processes are gone. yt-dlp's stderr goes to the `errors`
+    # temp file rather than a pipe, so it can never block on a full
+    # pipe buffer while nobody is reading it
+    released = False
+
+    def finish():
+        nonlocal released
+        reap(procs)
+        errors.close()
+        if not released:
+            released = True
+            download_slots.release()
+
+    # Read the first chunk up front so failures before any output
+    # (unavailable video, bad format, ...) still produce a JSON error
+    out = procs[-1].stdout
+    try:
+        first = out.read(CHUNK_SIZE)
+    except BaseException:
+        finish()
+        raise
+    if not first:
+        for p in procs:
+            p.wait()
+        err = error_message(errors)
+        finish()
+        return jsonify({"error": err}), 500
+
+    def generate():
+        # Tee the stream into DOWNLOAD_DIR and only publish it under
+        # cache_to once every process in the pipeline exited cleanly.
+        # Caching is best effort: if the disk fills up the copy is
+        # dropped and the client still gets the rest of the stream
+        f = part = None
+        try:
+            fd, part = tempfile.mkstemp(
+                dir=DOWNLOAD_DIR, prefix=cache_to.name + ".", suffix=".part")
+            f = os.fdopen(fd, "wb")
+        except OSError:
+            f, part = discard_part(f, part)
+        try:
+            chunk = first
+            while chunk:
+                if f is not None:
+                    try:
+                        f.write(chunk)
+                    except OSError:
+                        f, part = discard_part(f, part)
+                yield chunk
+                chunk = out.read(CHUNK_SIZE)
+            if f is not None and all(p.wait() == 0 for p in procs):
+                try:
+                    f.close()
+                    os.replace(part, cache_to)
+                    f = part = None
+                except OSError:
+                    pass
+        finally:
+            reap(procs)
+            discard_part(f, part)
+
+    # Runs even if the client goes away before the body is started
+    resp = Response(generate(), mimetype=mimetype, headers={
+        "Content-Disposition": content_disposition(download_name),
+        "Accept-Ranges": "none",
+    })
+    resp.call_on_close(finish)
+    return resp
+
+# ================== BACKGROUND GC ==================
+# Sweep DOWNLOAD_DIR off the request path instead of on every download
+GC_INTERVAL = 300
+threading.Thread(target=_gc_loop, daemon=True).start()
 
 # ================== ROUTES ==================
 @app.route("/")
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return Response(_INDEX_BYTES, mimetype="text/html")
 
 
 @app.route("/api/video-info", methods=["POST"])
@@ -159,85 +607,114 @@ def video_info():
         if not validate_youtube_url(url):
             return jsonify({"error": "Invalid YouTube URL"}), 400
 
-        opts = get_ydl_opts()
-        opts["skip_download"] = True
-
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = get_info(url)
+        if info is None:
+            return jsonify({"error": "Playlists are not supported"}), 400
 
-        return jsonify({
-            "title": info.get("title"),
-            "duration": info.get("duration"),
-            "uploader": info.get("uploader")
-        })
+        return jsonify(info)
 
+    except ServerBusy:
+        return busy()
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/download/video", methods=["POST"])
+@app.route("/api/download/video", methods=["GET", "POST"])
 def download_video():
     try:
-        url = request.json.get("url", "").strip()
+        url = get_request_url()
         if not validate_youtube_url(url):
             return jsonify({"error": "Invalid YouTube URL"}), 400
 
-        clean_old_files()
-        ts = int(time.time())
-        outtmpl = str(DOWNLOAD_DIR / f"video_{ts}_%(title)s.%(ext)s")
-
-        opts = get_ydl_opts()
-        opts.update({
-            "format": "best[ext=mp4]/best",
-            "outtmpl": outtmpl,
-            "merge_output_format": "mp4",
-        })
-
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            filename = ydl.prepare_filename(info)
-
-        title = clean_filename(info.get("title", "video"))
-        return send_file(filename, as_attachment=True,
-                         download_name=f"{title}.mp4",
-                         mimetype="video/mp4")
-
+        info = get_info(url)
+        if info is None:
+            return jsonify({"error": "Playlists are not supported"}), 400
+
+        title = clean_filename(info["title"] or "video")
+        cached = cache_path(info["id"], "mp4")
+        if cached.exists():
+            return send_cached(cached, "video/mp4", f"{title}.mp4")
+        if request.method == "HEAD":
+            return not_cached("video/mp4", f"{title}.mp4")
+
+        download_slots.acquire()
+        errors = None
+        try:
+            errors = tempfile.TemporaryFile()
+            # Merges are stream-copied into a fragmented MP4: stdout
+            # cannot be seeked for +faststart, and fragments are just as
+            # playable before the download completes
+            fmt = info_cache.get(("video_format", info["id"]), MERGED_FORMAT)
+            proc = spawn_ydl(
+                url, info["id"], fmt,
+                "--merge-output-format", "mp4",
+                "--downloader-args",
+                "ffmpeg_o:-c copy -f mp4 -movflags +frag_keyframe+empty_moov",
+                stderr=errors,
+            )
+        except BaseException:
+            if errors is not None:
+                errors.close()
+            download_slots.release()
+            raise
+
+        return stream_process([proc], errors, "video/mp4", f"{title}.mp4",
+                              cached)
+
+    except ServerBusy:
+        return busy()
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/download/audio", methods=["POST"])
+@app.route("/api/download/audio", methods=["GET", "POST"])
 def download_audio():
     try:
-        url = request.json.get("url", "").strip()
+        url = get_request_url()
         if not validate_youtube_url(url):
             return jsonify({"error": "Invalid YouTube URL"}), 400
 
-        clean_old_files()
-        ts = int(time.time())
-        outtmpl = str(DOWNLOAD_DIR / f"audio_{ts}_%(title)s.%(ext)s")
-
-        opts = get_ydl_opts()
-        opts.update({
-            "format": "bestaudio/best",
-            "outtmpl": outtmpl,
-            "postprocessors": [{
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "192",
-            }],
-        })
-
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            base = ydl.prepare_filename(info)
-            mp3 = os.path.splitext(base)[0] + ".mp3"
-
-        title = clean_filename(info.get("title", "audio"))
-        return send_file(mp3, as_attachment=True,
-                         download_name=f"{title}.mp3",
-                         mimetype="audio/mpeg")
-
+        info = get_info(url)
+        if info is None:
+            return jsonify({"error": "Playlists are not supported"}), 400
+
+        title = clean_filename(info["title"] or "audio")
+        cached = cache_path(info["id"], "mp3")
+        if cached.exists():
+            return send_cached(cached, "audio/mpeg", f"{title}.mp3")
+        if request.method == "HEAD":
+            return not_cached("audio/mpeg", f"{title}.mp3")
+
+        download_slots.acquire()
+        errors = ydl = None
+        try:
+            errors = tempfile.TemporaryFile()
+            ydl = spawn_ydl(url, info["id"], "bestaudio/best",
+                            stderr=errors)
+            # Transcoding runs in its own ffmpeg process per request, so
+            # concurrent audio downloads already spread across all cores
+            ffmpeg = subprocess.Popen(
+                [FFMPEG_PATH or "ffmpeg", "-loglevel", "error",
+                 "-threads", "0", "-i", "pipe:0", "-vn",
+                 "-f", "mp3", "-q:a", "4", "pipe:1"],
+                stdin=ydl.stdout, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, bufsize=CHUNK_SIZE,
+            )
+        except BaseException:
+            if ydl is not None:
+                reap([ydl])
+            if errors is not None:
+                errors.close()
+            download_slots.release()
+            raise
+        # Only ffmpeg holds the read end now, so it sees EOF when yt-dlp exits
+        ydl.stdout.close()
+
+        return stream_process([ydl, ffmpeg], errors, "audio/mpeg",
+                              f"{title}.mp3", cached)
+
+    except ServerBusy:
+        return busy()
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -245,9 +722,3 @@ def download_audio():
 @app.route("/health")
 def health():
     return jsonify({"status": "ok"})
-
-
-# ================== MAIN ==================
-if __name__ == "__main__":
-    print("🚀 YouTube Downloader running")
-    app.run(host="0.0.0.0", port=5000)
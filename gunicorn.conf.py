@@ -0,0 +1,13 @@
+import os
+
+# Downloads are I/O bound and can take minutes, so serve them from
+# cooperative greenlets rather than one blocked thread per download
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = os.cpu_count()
+worker_class = "gevent"
+worker_connections = 1000
+timeout = 600
+# Under gevent workers gunicorn's sendfile goes through gevent's
+# socket.sendfile(), which is a Python read()/send() loop, so cached files
+# are only sent zero-copy when the proxy serves them (X_ACCEL_PREFIX or
+# USE_X_SENDFILE, see README)